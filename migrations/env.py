@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import create_async_engine
 
 # Import your models and configuration
 from app.core.config import settings
-from app.models import BaseModel
+from app.models import load_all_models
 
 # This is the Alembic Config object
 config = context.config
@@ -29,7 +29,7 @@ if config.config_file_name is not None:
 config.set_main_option("sqlalchemy.url", settings.database_url)
 
 # Add your model's MetaData object here for 'autogenerate' support
-target_metadata = BaseModel.metadata
+target_metadata = load_all_models().metadata
 
 
 def run_migrations_offline() -> None:
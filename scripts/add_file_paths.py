@@ -9,18 +9,65 @@ Usage:
     python scripts/add_file_paths.py check          # Check consistency only
     python scripts/add_file_paths.py fix            # Add/update comments
     python scripts/add_file_paths.py fix --verbose  # With detailed output
+    python scripts/add_file_paths.py fix --async    # Process files with asyncio
 """
 
+import asyncio
+import os
 import re
+import stat
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
-import typer
+if TYPE_CHECKING:
+    import typer
 
-app = typer.Typer(
-    help="Automatically add/update file path comments in Python files",
-    add_completion=False,
-)
+# Pattern to match existing path comments
+_PATH_COMMENT_RE = re.compile(r"^#\s+[\w\/\.]+\s*$")
+
+# Files smaller than this (in bytes) are left untouched
+_MIN_FILE_SIZE = 10
+
+# Comments always use forward slashes; only non-POSIX separators need mapping
+_SEP_TRANSLATION = str.maketrans(os.sep, "/") if os.sep != "/" else None
+
+# Maximum number of files in flight when processing with asyncio
+_ASYNC_CONCURRENCY = 64
+
+# Directories that never contain project sources
+_SKIP_DIRS = frozenset({".git", ".venv", "venv", "__pycache__", "node_modules"})
+
+
+def _walk_python_files(root: str) -> Iterator[str]:
+    """
+    Recursively yield paths of Python files under root.
+
+    Uses os.scandir directly so only matching entries are turned into
+    path strings, and pruned directories are never descended into.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Path strings of Python files
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    yield from _walk_python_files(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                yield entry.path
 
 
 class FilePathCommenter:
@@ -28,37 +75,64 @@ class FilePathCommenter:
 
     def __init__(self, src_dir: str = "src", verbose: bool = False):
         self.src_dir = Path(src_dir).resolve()
+        # Files are discovered under src_dir, so the prefix can be sliced off
+        self._src_prefix_len = len(os.path.join(os.fspath(self.src_dir), ""))
+        # Relative "a/b/" prefix per absolute directory path
+        self._dir_prefixes: dict[str, str] = {}
         self.verbose = verbose
         self.modified_files: list[str] = []
         self.errors: list[str] = []
-
-        # Pattern to match existing path comments
-        self.path_comment_pattern = re.compile(r"^#\s+[\w\/\.]+\s*$")
+        # Guards modified_files/errors and log output shared by worker threads
+        self._lock = threading.Lock()
 
     def log(self, message: str, level: str = "INFO") -> None:
-        """Log messages if verbose mode is enabled."""
+        """
+        Log messages if verbose mode is enabled.
+
+        Per-file call sites check self.verbose themselves so the message is
+        not even formatted in the default, quiet mode.
+        """
         if self.verbose:
-            typer.echo(f"[{level}] {message}")
+            # Workers log concurrently; keep each line intact
+            with self._lock:
+                print(f"[{level}] {message}")
+
+    def _record_error(self, kind: str, file_path: Path, exc: Exception) -> None:
+        """
+        Record a per-file failure, logging it in verbose mode.
+
+        Args:
+            kind: Failure category, e.g. "Read" or "Write"
+            file_path: Path to the file that failed
+            exc: The exception that was raised
+        """
+        message = f"{kind} error: {file_path}"
+        # Workers fail concurrently; one lock covers the list and the log line
+        with self._lock:
+            self.errors.append(message)
+            if self.verbose:
+                print(f"[ERROR] {message} ({exc})")
 
     def get_relative_path(self, file_path: Path) -> str:
         """
         Get the relative path from src directory, formatted for comment.
 
         Args:
-            file_path: Path to the Python file
+            file_path: Path to a Python file located under the src directory
 
         Returns:
             Relative path string (e.g., "app/core/config")
         """
-        try:
-            # Get path relative to src directory
-            relative_path = file_path.relative_to(self.src_dir)
-            # Convert to forward slashes for comment
-            return str(relative_path).replace("\\", "/")
-        except ValueError as e:
-            self.log(f"Error getting relative path for {file_path}: {e}", "ERROR")
-            self.errors.append(f"Path error: {file_path}")
-            return ""
+        directory, name = os.path.split(os.fspath(file_path))
+        # Files are visited directory by directory, so the prefix is reused
+        dir_prefix = self._dir_prefixes.get(directory)
+        if dir_prefix is None:
+            relative_dir = directory[self._src_prefix_len :]
+            if _SEP_TRANSLATION is not None:
+                relative_dir = relative_dir.translate(_SEP_TRANSLATION)
+            dir_prefix = f"{relative_dir}/" if relative_dir else ""
+            self._dir_prefixes[directory] = dir_prefix
+        return dir_prefix + name
 
     def should_process_file(self, file_path: Path) -> bool:
         """
@@ -77,69 +151,143 @@ class FilePathCommenter:
         # Skip common files that shouldn't have path comments
         skip_files = {"__init__.py"}
         if file_path.name in skip_files:
-            self.log(f"Skipping {file_path.name} (excluded file)", "DEBUG")
+            if self.verbose:
+                self.log(f"Skipping {file_path.name} (excluded file)", "DEBUG")
             return False
 
-        # Skip if file is empty or very small
+        return True
+
+    def has_expected_header(self, file_path: Path, expected: bytes) -> bool:
+        """
+        Check whether a file starts with the expected header bytes.
+
+        Only reads as many bytes as the header is long, which is enough to
+        confirm the common case of an already up-to-date file.
+
+        Args:
+            file_path: Path to the file
+            expected: Encoded header to look for
+
+        Returns:
+            True if the file starts with the expected bytes
+        """
         try:
-            if file_path.stat().st_size < 10:  # Less than 10 bytes
-                self.log(f"Skipping {file_path} (too small)", "DEBUG")
-                return False
+            with file_path.open("rb") as f:
+                return f.read(len(expected)) == expected
         except OSError:
+            # Let the full read report the error
             return False
 
-        return True
-
-    def read_file_lines(self, file_path: Path) -> list[str] | None:
+    def read_file_head_and_body(self, file_path: Path) -> tuple[bytes, bytes] | None:
         """
-        Read file lines with proper encoding handling.
+        Read raw file contents, splitting off the first line.
+
+        Only the first line is needed to classify a file, so the rest of the
+        content is kept as opaque bytes and written back verbatim.
 
         Args:
             file_path: Path to the file
 
         Returns:
-            List of lines or None if error
+            Tuple of (first_line, data) or None if error
         """
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                return f.readlines()
-        except (UnicodeDecodeError, OSError) as e:
-            self.log(f"Error reading {file_path}: {e}", "ERROR")
-            self.errors.append(f"Read error: {file_path}")
+            data = file_path.read_bytes()
+        except OSError as e:
+            self._record_error("Read", file_path, e)
             return None
 
-    def write_file_lines(self, file_path: Path, lines: list[str]) -> bool:
+        first_line_end = data.find(b"\n") + 1 or len(data)
+        return data[:first_line_end], data
+
+    def write_file_atomic(self, file_path: Path, data: bytes) -> bool:
+        """
+        Write raw file contents atomically.
+
+        Content is written to a temporary file next to the real target in a
+        single call and then moved over it, so an interrupted run never leaves
+        a truncated file behind. Symlinks are resolved first so the link
+        itself is preserved. Hard-linked files, and files whose ownership
+        cannot be reproduced, are rewritten in place instead, since replacing
+        them would detach the other links or change the owner.
+
+        Args:
+            file_path: Path to the file
+            data: Content to write
+
+        Returns:
+            True if successful
+        """
+        target = Path(os.path.realpath(file_path))
+        tmp_path: Path | None = None
+        try:
+            st = target.stat()
+            if st.st_nlink > 1:
+                target.write_bytes(data)
+                return True
+
+            # Unique name, since a symlink and its target may be fixed at once
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f".{target.name}.", suffix=".tmp", dir=target.parent
+            )
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+            tmp_st = tmp_path.stat()
+            if (tmp_st.st_uid, tmp_st.st_gid) != (st.st_uid, st.st_gid):
+                try:
+                    os.chown(tmp_path, st.st_uid, st.st_gid)
+                except OSError:
+                    tmp_path.unlink()
+                    target.write_bytes(data)
+                    return True
+
+            os.replace(tmp_path, target)
+            return True
+        except OSError as e:
+            self._record_error("Write", file_path, e)
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            return False
+
+    def write_header_in_place(self, file_path: Path, header: bytes) -> bool:
         """
-        Write file lines with proper encoding.
+        Overwrite the start of a file without rewriting the rest.
+
+        Only valid when the new header has exactly the same length as the
+        bytes it replaces, which is the usual case when a path comment is
+        updated.
 
         Args:
             file_path: Path to the file
-            lines: Lines to write
+            header: Replacement bytes for the start of the file
 
         Returns:
             True if successful
         """
         try:
-            with file_path.open("w", encoding="utf-8") as f:
-                f.writelines(lines)
+            with file_path.open("r+b") as f:
+                f.write(header)
             return True
         except OSError as e:
-            self.log(f"Error writing {file_path}: {e}", "ERROR")
-            self.errors.append(f"Write error: {file_path}")
+            self._record_error("Write", file_path, e)
             return False
 
-    def get_expected_comment(self, file_path: Path) -> str:
+    def get_expected_comment(self, file_path: Path) -> bytes:
         """
         Generate the expected path comment for a file.
 
+        The comment is encoded once so it can be compared against, and
+        written to, the raw file contents directly.
+
         Args:
             file_path: Path to the file
 
         Returns:
-            Expected comment line
+            Expected comment line, UTF-8 encoded
         """
-        relative_path = self.get_relative_path(file_path)
-        return f"# {relative_path}\n"
+        return f"# {self.get_relative_path(file_path)}\n".encode()
 
     def process_file(
         self, file_path: Path, fix_mode: bool = False
@@ -157,160 +305,290 @@ class FilePathCommenter:
         if not self.should_process_file(file_path):
             return False, False
 
-        lines = self.read_file_lines(file_path)
-        if lines is None:
+        expected_comment = self.get_expected_comment(file_path)
+
+        # Fast path: most files already carry the exact expected header
+        if self.has_expected_header(file_path, expected_comment):
+            if self.verbose:
+                self.log(f"✓ {file_path.name} - correct comment", "DEBUG")
             return False, False
 
-        if not lines:  # Empty file
+        content = self.read_file_head_and_body(file_path)
+        if content is None:
             return False, False
 
-        expected_comment = self.get_expected_comment(file_path)
-        if not expected_comment.strip():  # Couldn't generate valid path
+        first_line, data = content
+        if len(data) < _MIN_FILE_SIZE:  # Empty or very small file
+            if self.verbose:
+                self.log(f"Skipping {file_path} (too small)", "DEBUG")
             return False, False
 
         needs_fix = False
-        first_line = lines[0]
+        stripped = first_line.strip()
 
         # Check if first line is already the correct path comment
-        if first_line.strip() == expected_comment.strip():
-            self.log(f"✓ {file_path.name} - correct comment", "DEBUG")
+        if stripped == expected_comment.rstrip():
+            if self.verbose:
+                self.log(f"✓ {file_path.name} - correct comment", "DEBUG")
+            return False, False
+
+        # Only decode the first line once it is known not to match
+        try:
+            first_line_text = stripped.decode("utf-8")
+        except UnicodeDecodeError as e:
+            self._record_error("Read", file_path, e)
             return False, False
 
         # Check if first line is a different path comment
-        if self.path_comment_pattern.match(first_line.strip()):
-            self.log(f"⚠ {file_path.name} - incorrect path comment", "INFO")
+        if first_line_text.startswith("#") and _PATH_COMMENT_RE.match(first_line_text):
+            if self.verbose:
+                self.log(f"⚠ {file_path.name} - incorrect path comment", "INFO")
             needs_fix = True
             if fix_mode:
-                lines[0] = expected_comment
-                if self.write_file_lines(file_path, lines):
-                    self.modified_files.append(str(file_path))
-                    self.log(f"✓ Updated comment in {file_path.name}", "INFO")
+                if len(first_line) == len(expected_comment):
+                    # Same-length comment: only the header bytes change
+                    written = self.write_header_in_place(file_path, expected_comment)
+                else:
+                    body = data.partition(b"\n")[2]
+                    written = self.write_file_atomic(file_path, expected_comment + body)
+                if written:
+                    with self._lock:
+                        self.modified_files.append(str(file_path))
+                    if self.verbose:
+                        self.log(f"✓ Updated comment in {file_path.name}", "INFO")
                     return True, True
         else:
             # No path comment exists, add one
-            self.log(f"⚠ {file_path.name} - missing path comment", "INFO")
+            if self.verbose:
+                self.log(f"⚠ {file_path.name} - missing path comment", "INFO")
             needs_fix = True
             if fix_mode:
-                lines.insert(0, expected_comment)
-                if self.write_file_lines(file_path, lines):
-                    self.modified_files.append(str(file_path))
-                    self.log(f"✓ Added comment to {file_path.name}", "INFO")
+                if self.write_file_atomic(file_path, expected_comment + data):
+                    with self._lock:
+                        self.modified_files.append(str(file_path))
+                    if self.verbose:
+                        self.log(f"✓ Added comment to {file_path.name}", "INFO")
                     return True, True
 
         return needs_fix, False
 
-    def find_python_files(self) -> list[Path]:
+    def iter_python_files(self) -> Iterator[Path]:
         """
-        Find all Python files in the src directory.
+        Lazily yield all Python files in the src directory.
 
-        Returns:
-            List of Python file paths
+        Yields:
+            Python file paths, as the directory walk discovers them
         """
         if not self.src_dir.exists():
             self.log(f"Source directory {self.src_dir} does not exist", "ERROR")
             self.errors.append(f"Directory not found: {self.src_dir}")
-            return []
+            return
+
+        for file_path in _walk_python_files(str(self.src_dir)):
+            yield Path(file_path)
 
-        python_files = []
-        for file_path in self.src_dir.rglob("*.py"):
-            if file_path.is_file():
-                python_files.append(file_path)
+    def process_files_threaded(self, fix_mode: bool) -> tuple[int, list[Path]]:
+        """
+        Process all Python files on a thread pool.
 
-        self.log(f"Found {len(python_files)} Python files", "INFO")
-        return python_files
+        Args:
+            fix_mode: Whether to actually modify the files
 
-    def run(self, check_mode: bool = False) -> int:
+        Returns:
+            Tuple of (files_found, files_needing_fix)
+        """
+        files_needing_fix: list[Path] = []
+        files_found = 0
+
+        # Processing is dominated by blocking file I/O, which releases the GIL
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        # Bound in-flight work so memory does not grow with the tree size
+        max_pending = max_workers * 4
+        pending: dict[Future[tuple[bool, bool]], Path] = {}
+
+        def collect(done: Iterable[Future[tuple[bool, bool]]]) -> None:
+            for future in done:
+                file_path = pending.pop(future)
+                needs_fix, was_modified = future.result()
+                if needs_fix and not was_modified:
+                    files_needing_fix.append(file_path)
+
+        # Submit as the walk proceeds so processing overlaps discovery
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path in self.iter_python_files():
+                files_found += 1
+                future = executor.submit(self.process_file, file_path, fix_mode)
+                pending[future] = file_path
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(as_completed(list(pending)))
+
+        return files_found, files_needing_fix
+
+    async def process_files_async(self, fix_mode: bool) -> tuple[int, list[Path]]:
+        """
+        Process all Python files from an asyncio event loop.
+
+        Blocking file I/O runs in worker threads while a semaphore bounds the
+        number of files in flight, so the directory walk keeps feeding work
+        without spawning a thread per file.
+
+        Args:
+            fix_mode: Whether to actually modify the files
+
+        Returns:
+            Tuple of (files_found, files_needing_fix)
+        """
+        files_needing_fix: list[Path] = []
+        files_found = 0
+        semaphore = asyncio.Semaphore(_ASYNC_CONCURRENCY)
+
+        async def process(file_path: Path) -> None:
+            try:
+                needs_fix, was_modified = await asyncio.to_thread(
+                    self.process_file, file_path, fix_mode
+                )
+            finally:
+                semaphore.release()
+            if needs_fix and not was_modified:
+                files_needing_fix.append(file_path)
+
+        # The task group awaits every worker and re-raises any failure, so a
+        # broken file cannot be reported as a clean run
+        async with asyncio.TaskGroup() as group:
+            for file_path in self.iter_python_files():
+                files_found += 1
+                await semaphore.acquire()
+                group.create_task(process(file_path))
+
+        return files_found, files_needing_fix
+
+    def run(self, check_mode: bool = False, use_async: bool = False) -> int:
         """
         Run the file path comment automation.
 
         Args:
             check_mode: If True, only check for inconsistencies
+            use_async: If True, drive file processing from an asyncio event loop
 
         Returns:
             Exit code (0 = success, 1 = errors found)
         """
-        python_files = self.find_python_files()
-        if not python_files:
-            typer.echo("No Python files found to process")
+        fix_mode = not check_mode
+
+        if use_async:
+            files_found, files_needing_fix = asyncio.run(
+                self.process_files_async(fix_mode)
+            )
+        else:
+            files_found, files_needing_fix = self.process_files_threaded(fix_mode)
+
+        if not files_found:
+            print("No Python files found to process")
             return 0 if not self.errors else 1
 
-        files_needing_fix = []
-        fix_mode = not check_mode
+        self.log(f"Processed {files_found} Python files", "INFO")
 
-        for file_path in python_files:
-            needs_fix, was_modified = self.process_file(file_path, fix_mode)
-            if needs_fix and not was_modified:
-                files_needing_fix.append(file_path)
+        # Completion order is arbitrary, keep the report deterministic
+        files_needing_fix.sort()
+        self.modified_files.sort()
 
         # Report results
         if check_mode:
             if files_needing_fix:
-                typer.echo(
-                    f"\n❌ {len(files_needing_fix)} files need path comment fixes:"
-                )
+                print(f"\n❌ {len(files_needing_fix)} files need path comment fixes:")
                 for file_path in files_needing_fix:
-                    typer.echo(f"  - {file_path}")
-                typer.echo(
+                    print(f"  - {file_path}")
+                print(
                     "\nRun 'python scripts/add_file_paths.py fix' to automatically update these files"
                 )
                 return 1
-            typer.echo("✅ All files have correct path comments")
+            print("✅ All files have correct path comments")
             return 0
         if self.modified_files:
-            typer.echo(f"\n✅ Updated {len(self.modified_files)} files:")
+            print(f"\n✅ Updated {len(self.modified_files)} files:")
             for file_path in self.modified_files:
-                typer.echo(f"  - {file_path}")
+                print(f"  - {file_path}")
         else:
-            typer.echo("✅ No files needed updates")
+            print("✅ No files needed updates")
 
         if self.errors:
-            typer.echo(f"\n⚠ {len(self.errors)} errors occurred:")
+            print(f"\n⚠ {len(self.errors)} errors occurred:")
             for error in self.errors:
-                typer.echo(f"  - {error}")
+                print(f"  - {error}")
             return 1
 
         return 0
 
 
-@app.command()
-def check(
-    src_dir: Annotated[
-        str, typer.Option("--src-dir", help="Source directory to process")
-    ] = "src",
-    verbose: Annotated[
-        bool, typer.Option("--verbose", "-v", help="Show detailed progress information")
-    ] = False,
-):
-    """Check if files have correct path comments without modifying them."""
-    commenter = FilePathCommenter(src_dir=src_dir, verbose=verbose)
-    exit_code = commenter.run(check_mode=True)
-    raise typer.Exit(exit_code)
-
-
-@app.command()
-def fix(
-    src_dir: Annotated[
-        str, typer.Option("--src-dir", help="Source directory to process")
-    ] = "src",
-    verbose: Annotated[
-        bool, typer.Option("--verbose", "-v", help="Show detailed progress information")
-    ] = False,
-):
-    """Automatically add/update path comments in Python files."""
-    commenter = FilePathCommenter(src_dir=src_dir, verbose=verbose)
-    exit_code = commenter.run(check_mode=False)
-    raise typer.Exit(exit_code)
-
-
-@app.callback()
-def main():
+def create_cli() -> "typer.Typer":
     """
-    File Path Comment Automation Tool
+    Create the command line interface.
 
-    Automatically adds/updates file path comments on the first line
-    of Python files within the 'src' directory structure.
+    typer is imported here rather than at module level so that importing
+    FilePathCommenter does not pay for loading the CLI stack.
     """
+    import typer
+
+    app = typer.Typer(
+        help="Automatically add/update file path comments in Python files",
+        add_completion=False,
+    )
+
+    @app.command()
+    def check(
+        src_dir: Annotated[
+            str, typer.Option("--src-dir", help="Source directory to process")
+        ] = "src",
+        verbose: Annotated[
+            bool,
+            typer.Option("--verbose", "-v", help="Show detailed progress information"),
+        ] = False,
+        use_async: Annotated[
+            bool,
+            typer.Option(
+                "--async", help="Process files with asyncio instead of threads"
+            ),
+        ] = False,
+    ):
+        """Check if files have correct path comments without modifying them."""
+        commenter = FilePathCommenter(src_dir=src_dir, verbose=verbose)
+        exit_code = commenter.run(check_mode=True, use_async=use_async)
+        raise typer.Exit(exit_code)
+
+    @app.command()
+    def fix(
+        src_dir: Annotated[
+            str, typer.Option("--src-dir", help="Source directory to process")
+        ] = "src",
+        verbose: Annotated[
+            bool,
+            typer.Option("--verbose", "-v", help="Show detailed progress information"),
+        ] = False,
+        use_async: Annotated[
+            bool,
+            typer.Option(
+                "--async", help="Process files with asyncio instead of threads"
+            ),
+        ] = False,
+    ):
+        """Automatically add/update path comments in Python files."""
+        commenter = FilePathCommenter(src_dir=src_dir, verbose=verbose)
+        exit_code = commenter.run(check_mode=False, use_async=use_async)
+        raise typer.Exit(exit_code)
+
+    @app.callback()
+    def main():
+        """
+        File Path Comment Automation Tool
+
+        Automatically adds/updates file path comments on the first line
+        of Python files within the 'src' directory structure.
+        """
+
+    return app
 
 
 if __name__ == "__main__":
-    app()
+    create_cli()()
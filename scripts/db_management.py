@@ -7,6 +7,7 @@ applying migrations, and resetting the database.
 
 import asyncio
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import typer
@@ -23,8 +24,9 @@ from app.core.database import db_config
 app = typer.Typer(help="Database management commands")
 
 
+@lru_cache(maxsize=1)
 def get_alembic_config() -> Config:
-    """Get Alembic configuration."""
+    """Get Alembic configuration (built once per process)."""
     alembic_cfg = Config("alembic.ini")
     alembic_cfg.set_main_option("sqlalchemy.url", settings.database_url)
     return alembic_cfg
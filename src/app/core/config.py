@@ -1,13 +1,18 @@
 # app/core/config.py
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_ALLOWED_ENVIRONMENTS = frozenset({"development", "staging", "production"})
+
 
 class Settings(BaseSettings):
     """
     Application settings with environment variable support.
+
+    Settings are loaded once and frozen, so derived values are computed
+    on first access and cached on the instance.
     """
 
     # Application Settings
@@ -53,31 +58,43 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(
         default=7, description="Refresh token expiration time in days"
     )
+    BCRYPT_ROUNDS: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description=(
+            "bcrypt cost factor for password hashes; existing hashes are "
+            "rehashed to this cost on the next successful login"
+        ),
+    )
 
     @field_validator("ENVIRONMENT")
     @classmethod
     def validate_environment(cls, value: str) -> str:
         """Ensure environment is one of the allowed values."""
-        allowed = ["development", "staging", "production"]
-        if value not in allowed:
-            raise ValueError(f"Environment must be one of: {allowed}")
+        if value not in _ALLOWED_ENVIRONMENTS:
+            raise ValueError(
+                f"Environment must be one of: {sorted(_ALLOWED_ENVIRONMENTS)}"
+            )
         return value
 
-    @property
-    def allowed_hosts_list(self) -> list[str]:
-        """Convert ALLOWED_HOSTS string to list."""
-        return [host.strip() for host in self.ALLOWED_HOSTS.split(",") if host.strip()]
-
-    @property
-    def allowed_origins_list(self) -> list[str]:
-        """Convert ALLOWED_ORIGINS string to list."""
-        return [
-            origin.strip()
-            for origin in self.ALLOWED_ORIGINS.split(",")
-            if origin.strip()
-        ]
-
-    @property
+    @cached_property
+    def allowed_hosts_list(self) -> tuple[str, ...]:
+        """Split ALLOWED_HOSTS string into an immutable tuple."""
+        return tuple(
+            host for host in map(str.strip, self.ALLOWED_HOSTS.split(",")) if host
+        )
+
+    @cached_property
+    def allowed_origins_list(self) -> tuple[str, ...]:
+        """Split ALLOWED_ORIGINS string into an immutable tuple."""
+        return tuple(
+            origin
+            for origin in map(str.strip, self.ALLOWED_ORIGINS.split(","))
+            if origin
+        )
+
+    @cached_property
     def database_url(self) -> str:
         """
         Get database URL. Use DATABASE_URL if provided, otherwise construct from components.
@@ -87,7 +104,7 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
-    @property
+    @cached_property
     def test_database_url(self) -> str:
         """
         Get test database URL. Use TEST_DATABASE_URL if provided, otherwise construct from components.
@@ -103,15 +120,15 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{test_db_name}"
         )
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         return self.ENVIRONMENT == "production"
 
-    @property
+    @cached_property
     def is_staging(self) -> bool:
         return self.ENVIRONMENT == "staging"
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         return self.ENVIRONMENT == "development"
 
@@ -119,6 +136,7 @@ class Settings(BaseSettings):
         env_file=".env",
         case_sensitive=True,
         extra="ignore",
+        frozen=True,
     )
 
 
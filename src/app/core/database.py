@@ -1,6 +1,8 @@
 # app/core/database.py
 import asyncio
 import logging
+import os
+import random
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -12,13 +14,21 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.core.config import settings
-from app.models import BaseModel
+from app.models import load_all_models
 
 logger = logging.getLogger(__name__)
 
+# Built once so SQLAlchemy reuses the compiled statement and asyncpg its prepared plan
+_HEALTH_CHECK_QUERY = text("SELECT 1 as health_check")
+
+# Per-process pool ceilings, so large hosts stay well under PostgreSQL's
+# default max_connections=100 even with a few workers
+_MAX_POOL_SIZE = 20
+_MAX_POOL_OVERFLOW = 10
+
 
 class DatabaseConfig:
     """Database configuration and connection management"""
@@ -49,19 +59,23 @@ class DatabaseConfig:
             "pool_pre_ping": True,  # Validate connections before use
             "pool_recycle": 3600,  # Recycle connections every hour
             "connect_args": {
+                # Per-connection LRU of asyncpg prepared statements
+                "prepared_statement_cache_size": 250,
                 "server_settings": {
                     "application_name": "task_management_api",
-                }
+                },
             },
         }
 
         # Add pool configuration based on environment
         if settings.is_production:
+            # Size the pool from the host, capped per process
+            cpu_count = os.cpu_count() or 4
             engine_kwargs.update(
                 {
-                    "poolclass": QueuePool,
-                    "pool_size": 10,
-                    "max_overflow": 20,
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_size": min(cpu_count * 2, _MAX_POOL_SIZE),
+                    "max_overflow": min(cpu_count * 4, _MAX_POOL_OVERFLOW),
                 }
             )
         else:
@@ -97,7 +111,8 @@ class DatabaseConfig:
             target_engine,
             class_=AsyncSession,
             expire_on_commit=False,
-            autoflush=True,
+            # Repositories flush explicitly; no implicit flush before queries
+            autoflush=False,
             autocommit=False,
         )
 
@@ -115,13 +130,15 @@ class DatabaseConfig:
         if not self.engine:
             self.create_engine()
 
+        metadata = load_all_models().metadata
+
         async with self.engine.begin() as conn:
             if drop_existing:
                 logger.warning("Dropping existing database tables")
-                await conn.run_sync(BaseModel.metadata.drop_all)
+                await conn.run_sync(metadata.drop_all)
 
             logger.info("Creating database tables")
-            await conn.run_sync(BaseModel.metadata.create_all)
+            await conn.run_sync(metadata.create_all)
 
     async def close(self) -> None:
         """Close database connections"""
@@ -140,14 +157,17 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
     Async context manager for database sessions.
 
     Provides proper session lifecycle management with automatic cleanup.
-    Use this in dependency injection for FastAPI endpoints.
+    The block is one unit of work: it commits on success and rolls back
+    on error.
     """
-    if not db_config.session_factory:
+    session_factory = db_config.session_factory
+    if session_factory is None:
         raise RuntimeError("Database session factory not initialized.")
 
-    async with db_config.session_factory() as session:
+    async with session_factory() as session:
         try:
             yield session
+            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -158,9 +178,27 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
 async def get_db() -> AsyncGenerator[AsyncSession]:
     """
     FastAPI dependency for database sessions.
+
+    Manages the session lifecycle inline instead of wrapping get_db_session,
+    saving a context manager layer on every request. Use get_db_session
+    outside of FastAPI dependencies. The request is one unit of work:
+    repositories only flush, and the session commits once on success.
     """
-    async with get_db_session() as session:
+    session_factory = db_config.session_factory
+    if session_factory is None:
+        raise RuntimeError("Database session factory not initialized.")
+
+    session = session_factory()
+    try:
         yield session
+        # FastAPI runs this before sending the response, so a failed COMMIT
+        # becomes a 500; tests/test_database.py guards that ordering
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
 
 
 async def check_database_health() -> dict[str, Any]:
@@ -190,7 +228,7 @@ async def check_database_health() -> dict[str, Any]:
         # Test database connectivity
         async with get_db_session() as session:
             # Simple query to test connectivity
-            result = await session.execute(text("SELECT 1 as health_check"))
+            result = await session.execute(_HEALTH_CHECK_QUERY)
             health_value = result.scalar()
 
             if health_value != 1:
@@ -214,13 +252,22 @@ async def check_database_health() -> dict[str, Any]:
         }
 
 
-async def wait_for_database(max_retries: int = 5, retry_interval: float = 5.0) -> None:
+async def wait_for_database(
+    max_retries: int = 10,
+    retry_interval: float = 5.0,
+    initial_interval: float = 0.1,
+) -> None:
     """
     Wait for database to become available with retry logic.
 
+    Retries back off exponentially with jitter, so a database that is almost
+    ready is picked up within a fraction of a second while a slow one is
+    still polled at most every retry_interval seconds.
+
     Args:
         max_retries: Maximum number of connection attempts
-        retry_interval: Time to wait between attempts in seconds
+        retry_interval: Maximum time to wait between attempts in seconds
+        initial_interval: Time to wait after the first failed attempt in seconds
 
     Raises:
         RuntimeError: If database is not available after max_retries
@@ -238,10 +285,15 @@ async def wait_for_database(max_retries: int = 5, retry_interval: float = 5.0) -
             logger.debug(f"Database connection attempt {attempt} failed: {e}")
 
         if attempt < max_retries:
+            delay = min(
+                retry_interval,
+                initial_interval * 2 ** (attempt - 1)
+                + random.uniform(0, initial_interval),
+            )
             logger.info(
-                f"Database not ready, retrying in {retry_interval}s... (attempt {attempt}/{max_retries})"
+                f"Database not ready, retrying in {delay:.2f}s... (attempt {attempt}/{max_retries})"
             )
-            await asyncio.sleep(retry_interval)
+            await asyncio.sleep(delay)
         else:
             logger.error(
                 f"Database failed to become available after {max_retries} attempts"
@@ -268,7 +320,7 @@ async def database_lifespan():
         logger.info("Database session factory created successfully")
 
         # Wait for database to be ready with retry logic
-        await wait_for_database(max_retries=5, retry_interval=5.0)
+        await wait_for_database(max_retries=10, retry_interval=5.0)
 
         logger.info("Database initialized successfully")
 
@@ -4,11 +4,15 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import get_settings
 from app.core.database import database_lifespan
 from app.routers import auth_router, tasks_router, users_router
 
+# Resolved once at import; settings do not change for the process lifetime
+_LOG_LEVEL = getattr(logging, get_settings().LOG_LEVEL.upper(), logging.INFO)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -22,19 +26,21 @@ async def lifespan(app: FastAPI):
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
     settings = get_settings()
+    is_production = settings.is_production
 
     app = FastAPI(
         title="Task Management API",
         description="A simple task management API built with FastAPI",
         version="1.0.0",
-        docs_url="/docs" if not settings.is_production else None,
-        redoc_url="/redoc" if not settings.is_production else None,
+        docs_url=None if is_production else "/docs",
+        redoc_url=None if is_production else "/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Configure logging
     logging.basicConfig(
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
+        level=_LOG_LEVEL,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
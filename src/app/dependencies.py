@@ -1,8 +1,8 @@
 # app/dependencies.py
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -13,8 +13,32 @@ from app.services.auth_service import AuthService
 from app.services.task_service import TaskService
 from app.services.user_service import UserService
 
+
+class BearerToken(HTTPBearer):
+    """
+    HTTP bearer scheme that returns the raw token string.
+
+    Parses the Authorization header directly instead of building an
+    HTTPAuthorizationCredentials model per request, while keeping the
+    OpenAPI security scheme and the error responses of HTTPBearer.
+    """
+
+    async def __call__(self, request: Request) -> str:  # type: ignore[override]
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if not (scheme and token):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated"
+            )
+        if scheme.lower() != "bearer":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Invalid authentication credentials",
+            )
+        return token
+
+
 # Security scheme
-security = HTTPBearer()
+security = BearerToken()
 
 
 # Repository Dependencies
@@ -52,16 +76,11 @@ def get_task_service(
 
 # Authentication Dependencies
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    token: str = Depends(security),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> User:
     """Get current authenticated user."""
-    if not credentials.credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token required"
-        )
-
-    return await auth_service.get_current_user(credentials.credentials)
+    return await auth_service.get_current_user(token)
 
 
 # Type annotations for convenience
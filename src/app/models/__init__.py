@@ -1,6 +1,53 @@
 # app/models/__init__.py
-from .base import BaseModel
-from .task import Task, TaskPriority, TaskStatus
-from .user import User
+"""
+Database models package.
 
-__all__ = ["BaseModel", "User", "Task", "TaskStatus", "TaskPriority"]
+Model classes are resolved lazily (PEP 562) so that importing a single name
+does not pull in every model module. Code that needs the complete metadata
+(schema creation, Alembic autogenerate) should call ``load_all_models``.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseModel
+    from .task import Task, TaskPriority, TaskStatus
+    from .user import User
+
+__all__ = ["BaseModel", "User", "Task", "TaskStatus", "TaskPriority", "load_all_models"]
+
+_NAME_TO_MODULE = {
+    "BaseModel": "base",
+    "Task": "task",
+    "TaskPriority": "task",
+    "TaskStatus": "task",
+    "User": "user",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache on the module so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
+def load_all_models() -> type["BaseModel"]:
+    """
+    Import every model module so the shared metadata is complete.
+
+    Returns:
+        The declarative base whose metadata now contains all tables.
+    """
+    for module_name in set(_NAME_TO_MODULE.values()):
+        import_module(f".{module_name}", __name__)
+    return __getattr__("BaseModel")
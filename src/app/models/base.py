@@ -1,20 +1,22 @@
 # app/models/base.py
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import DateTime
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
+from app.utils.ids import uuid7
+
 
 class BaseModel(DeclarativeBase):
     """
     Base class for all database models.
 
     Provides common columns and functionality that all entities should have:
-    - UUID primary key for security and scalability
+    - Time-ordered UUID (v7) primary key for security and index locality
     - Created/updated timestamps for audit trails
     - Proper timezone handling
     """
@@ -22,8 +24,7 @@ class BaseModel(DeclarativeBase):
     id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
-        index=True,
+        default=uuid7,
         comment="Unique identifier for the entity",
     )
 
@@ -1,10 +1,10 @@
 # app/models/task.py
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(StrEnum):
     """Task status enumeration."""
 
     TODO = "todo"
@@ -21,7 +21,7 @@ class TaskStatus(str, Enum):
     COMPLETED = "completed"
 
 
-class TaskPriority(str, Enum):
+class TaskPriority(StrEnum):
     """Task priority enumeration."""
 
     LOW = "low"
@@ -33,8 +33,16 @@ class Task(BaseModel):
     """Task model for task management."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Match the owner-scoped listings in TaskRepository so they are served
+        # in created_at order straight from the index, without a Sort node
+        Index("ix_tasks_owner_id_created_at", "owner_id", "created_at"),
+        Index(
+            "ix_tasks_owner_id_status_created_at", "owner_id", "status", "created_at"
+        ),
+    )
 
-    title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[TaskStatus] = mapped_column(default=TaskStatus.TODO, nullable=False)
     priority: Mapped[TaskPriority] = mapped_column(
@@ -50,7 +58,10 @@ class Task(BaseModel):
     )
 
     # Relationship with user
-    owner: Mapped["User"] = relationship("User", back_populates="tasks")
+    # Never loaded implicitly; query sites opt in with joinedload(Task.owner)
+    owner: Mapped["User"] = relationship(
+        "User", back_populates="tasks", lazy="raise_on_sql"
+    )
 
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
@@ -26,8 +26,14 @@ class User(BaseModel):
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
 
     # Relationship with tasks
+    # Never loaded implicitly; query sites opt in with selectinload(User.tasks).
+    # Deletes rely on the ON DELETE CASCADE foreign key instead of loading tasks.
     tasks: Mapped[list["Task"]] = relationship(
-        "Task", back_populates="owner", cascade="all, delete-orphan"
+        "Task",
+        back_populates="owner",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     def __repr__(self) -> str:
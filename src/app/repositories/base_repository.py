@@ -11,7 +11,15 @@ if TYPE_CHECKING:
 
 
 class BaseRepository[ModelType: BaseModel]:
-    """Base repository with common CRUD operations."""
+    """
+    Base repository with common CRUD operations.
+
+    Repositories only flush; the session owner (get_db / get_db_session)
+    commits once per unit of work so several writes share one transaction.
+    """
+
+    # Instantiated per request, so keep instances lean
+    __slots__ = ("model", "session")
 
     def __init__(self, session: AsyncSession, model: type[ModelType]):
         self.session = session
@@ -21,7 +29,7 @@ class BaseRepository[ModelType: BaseModel]:
         """Create a new record."""
         instance = self.model(**kwargs)
         self.session.add(instance)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(instance)
         return instance
 
@@ -47,16 +55,19 @@ class BaseRepository[ModelType: BaseModel]:
         if not update_data:
             return await self.get_by_id(id)
 
-        await self.session.execute(
-            update(self.model).where(self.model.id == id).values(**update_data)
+        # RETURNING hands back the updated row, so no follow-up SELECT is needed
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**update_data)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
         )
-        await self.session.commit()
-        return await self.get_by_id(id)
+        return result.scalar_one_or_none()
 
     async def delete(self, id: UUID) -> bool:
         """Delete record by ID."""
         result = await self.session.execute(
             delete(self.model).where(self.model.id == id)
         )
-        await self.session.commit()
         return result.rowcount > 0
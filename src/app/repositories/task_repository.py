@@ -1,8 +1,9 @@
 # app/repositories/task_repository.py
 from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.task import Task, TaskStatus
@@ -13,6 +14,8 @@ from .base_repository import BaseRepository
 class TaskRepository(BaseRepository[Task]):
     """Repository for Task operations."""
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession):
         super().__init__(session, Task)
 
@@ -36,6 +39,33 @@ class TaskRepository(BaseRepository[Task]):
         )
         return result.scalar_one_or_none()
 
+    async def update_by_owner_and_id(
+        self, owner_id: UUID, task_id: UUID, **kwargs: Any
+    ) -> Task | None:
+        """Update a task only if it belongs to the owner."""
+        # Remove None values
+        update_data = {k: v for k, v in kwargs.items() if v is not None}
+
+        if not update_data:
+            return await self.get_by_owner_and_id(owner_id, task_id)
+
+        # Ownership is part of the WHERE clause, so no pre-check SELECT is needed
+        result = await self.session.execute(
+            update(Task)
+            .where(Task.owner_id == owner_id, Task.id == task_id)
+            .values(**update_data)
+            .returning(Task)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_by_owner_and_id(self, owner_id: UUID, task_id: UUID) -> bool:
+        """Delete a task only if it belongs to the owner."""
+        result = await self.session.execute(
+            delete(Task).where(Task.owner_id == owner_id, Task.id == task_id)
+        )
+        return result.rowcount > 0
+
     async def get_by_status(
         self, owner_id: UUID, status: TaskStatus, skip: int = 0, limit: int = 100
     ) -> Sequence[Task]:
@@ -1,6 +1,6 @@
 # app/repositories/user_repository.py
 from pydantic import EmailStr
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -11,6 +11,8 @@ from .base_repository import BaseRepository
 class UserRepository(BaseRepository[User]):
     """Repository for User operations."""
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession):
         super().__init__(session, User)
 
@@ -28,10 +30,30 @@ class UserRepository(BaseRepository[User]):
 
     async def email_exists(self, email: EmailStr) -> bool:
         """Check if email already exists."""
-        user = await self.get_by_email(email)
-        return user is not None
+        result = await self.session.execute(select(exists().where(User.email == email)))
+        return bool(result.scalar())
 
     async def username_exists(self, username: str) -> bool:
         """Check if username already exists."""
-        user = await self.get_by_username(username)
-        return user is not None
+        result = await self.session.execute(
+            select(exists().where(User.username == username))
+        )
+        return bool(result.scalar())
+
+    async def check_conflicts(
+        self, email: EmailStr, username: str
+    ) -> tuple[bool, bool]:
+        """
+        Check email and username availability in a single round trip.
+
+        Returns:
+            Whether the email and the username are already taken.
+        """
+        result = await self.session.execute(
+            select(
+                exists().where(User.email == email),
+                exists().where(User.username == username),
+            )
+        )
+        email_taken, username_taken = result.one()
+        return bool(email_taken), bool(username_taken)
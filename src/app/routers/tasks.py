@@ -2,6 +2,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Query, status
+from pydantic import TypeAdapter
 
 from app.dependencies import CurrentUser, TaskServiceDep
 from app.models.task import TaskStatus
@@ -9,6 +10,9 @@ from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_TASK_LIST_ADAPTER = TypeAdapter(list[TaskResponse])
+
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
@@ -48,7 +52,7 @@ async def get_tasks(
     else:
         tasks = await task_service.get_user_tasks(current_user.id, skip, limit)
 
-    return [TaskResponse.model_validate(task) for task in tasks]
+    return _TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
@@ -1,4 +1,6 @@
 # app/services/auth_service.py
+import asyncio
+import time
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
@@ -12,24 +14,62 @@ from app.models.user import User
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import TokenData
 
+# Verified token payloads keyed by raw token, with their expiry timestamp.
+# Tokens are immutable, so a hit skips signature verification entirely.
+_TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: dict[str, tuple[TokenData, float]] = {}
+
+
+def _hash_password(password: str) -> str:
+    """Hash password using bcrypt (blocking)."""
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash (blocking)."""
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
+
+
+def _hash_cost(hashed_password: str) -> int:
+    """Return the bcrypt cost factor encoded in a hash ("$2b$<cost>$...")."""
+    return int(hashed_password.split("$", 3)[2])
+
+
+# Checked for unknown emails so login takes the same time either way. Built at
+# import so no login request ever pays for generating it.
+_DUMMY_PASSWORD_HASH = _hash_password("dummy-password")
+
 
 class AuthService:
     """Service for authentication operations."""
 
+    __slots__ = ("user_repository",)
+
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        """Hash password using bcrypt."""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+    async def hash_password(password: str) -> str:
+        """
+        Hash password using bcrypt.
+
+        bcrypt is CPU-bound but releases the GIL, so it runs in a worker
+        thread instead of stalling the event loop.
+        """
+        return await asyncio.to_thread(_hash_password, password)
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        """Verify password against hash."""
-        return bcrypt.checkpw(
-            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify password against hash.
+
+        Runs in a worker thread for the same reason as hash_password.
+        """
+        return await asyncio.to_thread(
+            _verify_password, plain_password, hashed_password
         )
 
     @staticmethod
@@ -57,13 +97,21 @@ class AuthService:
     @staticmethod
     def decode_token(token: str) -> TokenData:
         """Decode and validate JWT token."""
+        cached = _token_cache.get(token)
+        if cached is not None:
+            token_data, expires_at = cached
+            if expires_at > time.time():
+                return token_data
+            # Expired: drop it and let jwt.decode raise the usual error
+            _token_cache.pop(token, None)
+
         try:
             payload = jwt.decode(
                 token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
             )
             user_id: UUID = payload.get("sub")
             email: str = payload.get("email")
-            _token_type: str = payload.get("type")
+            token_type: str = payload.get("type")
 
             if user_id is None or email is None:
                 raise HTTPException(
@@ -71,7 +119,17 @@ class AuthService:
                     detail="Invalid token payload",
                 ) from None
 
-            return TokenData(user_id=user_id, email=email)
+            token_data = TokenData(user_id=user_id, email=email)
+            # Only access tokens are re-presented on every request; refresh
+            # tokens are decoded about once and would just crowd the cache
+            expires_at = payload.get("exp")
+            if token_type == "access" and expires_at is not None:
+                if len(_token_cache) >= _TOKEN_CACHE_MAXSIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del _token_cache[next(iter(_token_cache))]
+                _token_cache[token] = (token_data, expires_at)
+
+            return token_data
 
         except jwt.ExpiredSignatureError as e:
             raise HTTPException(
@@ -86,14 +144,24 @@ class AuthService:
         """Authenticate user with email and password."""
         user = await self.user_repository.get_by_email(email)
         if not user:
+            # Still pay for one bcrypt check so unknown emails aren't revealed
+            await self.verify_password(password, _DUMMY_PASSWORD_HASH)
             return None
 
-        if not self.verify_password(password, user.hashed_password):
+        if not await self.verify_password(password, user.hashed_password):
             return None
 
         if not user.is_active:
             return None
 
+        # Keep stored hashes at the configured cost, so a known email costs
+        # the same bcrypt work as the dummy check for an unknown one
+        if _hash_cost(user.hashed_password) != settings.BCRYPT_ROUNDS:
+            rehashed_user = await self.user_repository.update(
+                user.id, hashed_password=await self.hash_password(password)
+            )
+            user = rehashed_user or user
+
         return user
 
     async def login(self, email: EmailStr, password: str) -> dict[str, str]:
@@ -12,6 +12,8 @@ from app.schemas.task import TaskCreate, TaskUpdate
 class TaskService:
     """Service for task operations."""
 
+    __slots__ = ("task_repository",)
+
     def __init__(self, task_repository: TaskRepository):
         self.task_repository = task_repository
 
@@ -41,12 +43,8 @@ class TaskService:
         self, task_id: int, task_data: TaskUpdate, owner_id: UUID
     ) -> Task:
         """Update task (ensuring ownership)."""
-        # Verify task exists and belongs to user
-        await self.get_task_by_id(task_id, owner_id)
-
-        # Update task
-        updated_task = await self.task_repository.update(
-            task_id, **task_data.model_dump(exclude_unset=True)
+        updated_task = await self.task_repository.update_by_owner_and_id(
+            owner_id, task_id, **task_data.model_dump(exclude_unset=True)
         )
 
         if not updated_task:
@@ -58,11 +56,14 @@ class TaskService:
 
     async def delete_task(self, task_id: int, owner_id: UUID) -> bool:
         """Delete task (ensuring ownership)."""
-        # Verify task exists and belongs to user
-        await self.get_task_by_id(task_id, owner_id)
+        deleted = await self.task_repository.delete_by_owner_and_id(owner_id, task_id)
+
+        if not deleted:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+            ) from None
 
-        # Delete task
-        return await self.task_repository.delete(task_id)
+        return deleted
 
     async def get_tasks_by_status(
         self, owner_id: UUID, status: TaskStatus, skip: int = 0, limit: int = 100
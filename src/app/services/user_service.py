@@ -13,26 +13,31 @@ from .auth_service import AuthService
 class UserService:
     """Service for user operations."""
 
+    __slots__ = ("user_repository",)
+
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
     async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user."""
-        # Check if email already exists
-        if await self.user_repository.email_exists(user_data.email):
+        # Check email and username together in one query
+        email_taken, username_taken = await self.user_repository.check_conflicts(
+            user_data.email, user_data.username
+        )
+
+        if email_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
 
-        # Check if username already exists
-        if await self.user_repository.username_exists(user_data.username):
+        if username_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken"
             )
 
         # Hash password
-        hashed_password = AuthService.hash_password(user_data.password)
+        hashed_password = await AuthService.hash_password(user_data.password)
 
         # Create user
         user = await self.user_repository.create(
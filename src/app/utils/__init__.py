@@ -4,6 +4,7 @@ Utility functions and helpers for the Task Management API.
 
 This package contains reusable utilities that are used across the application:
 - Date and time handling
+- Identifier generation
 - String formatting and validation
 - Common data transformations
 - Helper functions for testing
@@ -21,6 +22,7 @@ from .dates import (
     utc_now,
     yesterday,
 )
+from .ids import uuid7
 
 __all__ = [
     "utc_now",
@@ -30,4 +32,5 @@ __all__ = [
     "hours_from_now",
     "yesterday",
     "tomorrow",
+    "uuid7",
 ]
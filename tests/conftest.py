@@ -15,7 +15,9 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.factory import create_app
-from app.models import BaseModel
+from app.models import load_all_models
+
+BaseModel = load_all_models()
 
 # Test settings
 settings = get_settings()
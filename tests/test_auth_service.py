@@ -0,0 +1,117 @@
+# tests/test_auth_service.py
+"""
+Tests for AuthService.
+Covers the in-process cache of verified access tokens and upgrading
+password hashes to the configured bcrypt cost on login.
+"""
+
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import bcrypt
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.user_repository import UserRepository
+from app.schemas.auth import TokenData
+from app.services import auth_service
+from app.services.auth_service import AuthService
+
+
+@pytest.fixture(autouse=True)
+def token_cache(monkeypatch) -> dict:
+    """Give each test an empty token cache."""
+    cache: dict = {}
+    monkeypatch.setattr(auth_service, "_token_cache", cache)
+    return cache
+
+
+def make_token_data(email: str = "cache@example.com") -> dict[str, str]:
+    """Build a JWT payload for a random user."""
+    return {"sub": str(uuid4()), "email": email}
+
+
+class TestDecodeTokenCache:
+    """Test caching of decoded tokens."""
+
+    def test_cache_hit_skips_verification(self, token_cache, monkeypatch):
+        """Test a cached access token is returned without calling jwt.decode."""
+        token = AuthService.create_access_token(make_token_data())
+        first = AuthService.decode_token(token)
+        assert token in token_cache
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("jwt.decode should not be called on a cache hit")
+
+        monkeypatch.setattr(auth_service.jwt, "decode", fail_decode)
+
+        assert AuthService.decode_token(token) is first
+
+    def test_refresh_token_not_cached(self, token_cache):
+        """Test refresh tokens are decoded but never cached."""
+        token = AuthService.create_refresh_token(make_token_data())
+
+        assert AuthService.decode_token(token).email == "cache@example.com"
+        assert token not in token_cache
+
+    def test_expired_entry_is_dropped(self, token_cache):
+        """Test an expired cached entry is removed and the token rejected."""
+        token = AuthService.create_access_token(
+            make_token_data(), expires_delta=timedelta(seconds=-10)
+        )
+        token_cache[token] = (
+            TokenData(user_id=uuid4(), email="cache@example.com"),
+            time.time() - 1,
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            AuthService.decode_token(token)
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Token has expired"
+        assert token not in token_cache
+
+    def test_evicts_oldest_at_maxsize(self, token_cache, monkeypatch):
+        """Test the oldest entry is evicted once the cache is full."""
+        monkeypatch.setattr(auth_service, "_TOKEN_CACHE_MAXSIZE", 2)
+        tokens = [
+            AuthService.create_access_token(make_token_data(f"user{i}@example.com"))
+            for i in range(3)
+        ]
+
+        for token in tokens:
+            AuthService.decode_token(token)
+
+        assert list(token_cache) == tokens[1:]
+
+
+class TestPasswordRehash:
+    """Test password hashes converge on the configured bcrypt cost."""
+
+    async def test_login_rehashes_outdated_cost(
+        self, test_session: AsyncSession, monkeypatch
+    ):
+        """Test a hash at another cost is replaced after a successful login."""
+        monkeypatch.setattr(
+            auth_service,
+            "settings",
+            auth_service.settings.model_copy(update={"BCRYPT_ROUNDS": 5}),
+        )
+        user_repo = UserRepository(test_session)
+        user = await user_repo.create(
+            email="rehash@example.com",
+            username="rehash",
+            full_name="Rehash User",
+            hashed_password=bcrypt.hashpw(b"secret123", bcrypt.gensalt(4)).decode(),
+        )
+
+        authenticated = await AuthService(user_repo).authenticate_user(
+            "rehash@example.com", "secret123"
+        )
+
+        assert authenticated is not None
+        assert authenticated.id == user.id
+        assert authenticated.hashed_password.startswith("$2b$05$")
+        assert bcrypt.checkpw(b"secret123", authenticated.hashed_password.encode())
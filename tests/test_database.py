@@ -0,0 +1,117 @@
+# tests/test_database.py
+"""
+Tests for the database session lifecycle.
+Runs the real get_db / get_db_session against the test database to check
+that a unit of work is committed on success and rolled back on error.
+"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette import status
+
+from app.core.database import db_config, get_db, get_db_session
+from app.repositories.user_repository import UserRepository
+
+USER_DATA = {
+    "email": "uow@example.com",
+    "username": "uowuser",
+    "full_name": "Unit Of Work",
+    "hashed_password": "hashed_password",
+}
+
+
+@pytest.fixture
+def session_factory(test_engine, monkeypatch) -> async_sessionmaker[AsyncSession]:
+    """Point the global database config at the test engine."""
+    factory = async_sessionmaker(test_engine, expire_on_commit=False, autoflush=False)
+    monkeypatch.setattr(db_config, "session_factory", factory)
+    return factory
+
+
+@pytest.fixture
+async def uow_client(session_factory) -> AsyncGenerator[AsyncClient]:
+    """Client for an app whose route writes through the real get_db."""
+    app = FastAPI()
+
+    @app.post("/users")
+    async def create_user(fail: bool = False, session: AsyncSession = Depends(get_db)):
+        await UserRepository(session).create(**USER_DATA)
+        if fail:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST)
+        return {"created": True}
+
+    # Report unhandled errors as responses, as a real server would
+    async with AsyncClient(
+        transport=ASGITransport(app=app, raise_app_exceptions=False),
+        base_url="http://test",
+    ) as ac:
+        yield ac
+
+
+async def user_exists(session_factory: async_sessionmaker[AsyncSession]) -> bool:
+    """Check for the test user from a separate session."""
+    async with session_factory() as session:
+        return await UserRepository(session).email_exists(USER_DATA["email"])
+
+
+class TestGetDb:
+    """Test the request-scoped session dependency."""
+
+    async def test_commits_on_success(self, uow_client: AsyncClient, session_factory):
+        """Test writes are visible to other sessions after the request."""
+        response = await uow_client.post("/users")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert await user_exists(session_factory) is True
+
+    async def test_rolls_back_on_http_exception(
+        self, uow_client: AsyncClient, session_factory
+    ):
+        """Test an HTTPException discards the request's writes."""
+        response = await uow_client.post("/users", params={"fail": True})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert await user_exists(session_factory) is False
+
+    async def test_failed_commit_returns_server_error(
+        self, uow_client: AsyncClient, session_factory, monkeypatch
+    ):
+        """Test a failed COMMIT surfaces as a 5xx instead of a sent 2xx.
+
+        get_db commits after the endpoint returns; this only reaches the
+        client if FastAPI runs dependency teardown before the response.
+        """
+
+        async def failing_commit(self):
+            raise RuntimeError("commit failed")
+
+        monkeypatch.setattr(AsyncSession, "commit", failing_commit)
+
+        response = await uow_client.post("/users")
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert await user_exists(session_factory) is False
+
+
+class TestGetDbSession:
+    """Test the session context manager used outside of FastAPI."""
+
+    async def test_commits_on_success(self, session_factory):
+        """Test writes are committed when the block exits normally."""
+        async with get_db_session() as session:
+            await UserRepository(session).create(**USER_DATA)
+
+        assert await user_exists(session_factory) is True
+
+    async def test_rolls_back_on_error(self, session_factory):
+        """Test writes are discarded when the block raises."""
+        with pytest.raises(RuntimeError):
+            async with get_db_session() as session:
+                await UserRepository(session).create(**USER_DATA)
+                raise RuntimeError("boom")
+
+        assert await user_exists(session_factory) is False
@@ -4,6 +4,8 @@ Simple tests for User and Task repositories.
 Tests basic CRUD operations and specific repository methods.
 """
 
+from uuid import uuid4
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -85,6 +87,14 @@ class TestUserRepository:
         assert await user_repo.username_exists("testuser") is True
         assert await user_repo.username_exists("notfound") is False
 
+    async def test_check_conflicts(self, user_repo: UserRepository, sample_user: User):
+        """Test checking email and username conflicts together."""
+        check = user_repo.check_conflicts
+        assert await check("test@example.com", "testuser") == (True, True)
+        assert await check("test@example.com", "other") == (True, False)
+        assert await check("new@example.com", "testuser") == (False, True)
+        assert await check("new@example.com", "other") == (False, False)
+
     async def test_update_user(self, user_repo: UserRepository, sample_user: User):
         """Test updating user."""
         updated_user = await user_repo.update(
@@ -274,6 +284,36 @@ class TestTaskRepository:
         found_task = await task_repo.get_by_id(sample_task.id)
         assert found_task is None
 
+    async def test_update_by_owner_and_id(
+        self, task_repo: TaskRepository, sample_user: User, sample_task: Task
+    ):
+        """Test updating a task scoped to its owner."""
+        updated_task = await task_repo.update_by_owner_and_id(
+            sample_user.id, sample_task.id, status=TaskStatus.IN_PROGRESS
+        )
+
+        assert updated_task is not None
+        assert updated_task.status == TaskStatus.IN_PROGRESS
+
+        # Another owner's ID matches no row
+        assert (
+            await task_repo.update_by_owner_and_id(
+                uuid4(), sample_task.id, status=TaskStatus.COMPLETED
+            )
+            is None
+        )
+
+    async def test_delete_by_owner_and_id(
+        self, task_repo: TaskRepository, sample_user: User, sample_task: Task
+    ):
+        """Test deleting a task scoped to its owner."""
+        assert await task_repo.delete_by_owner_and_id(uuid4(), sample_task.id) is False
+        assert (
+            await task_repo.delete_by_owner_and_id(sample_user.id, sample_task.id)
+            is True
+        )
+        assert await task_repo.get_by_id(sample_task.id) is None
+
     async def test_pagination(self, task_repo: TaskRepository, sample_user: User):
         """Test pagination in get_by_owner."""
         # Create multiple tasks
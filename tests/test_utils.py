@@ -0,0 +1,38 @@
+# tests/test_utils.py
+"""
+Tests for utility helpers.
+"""
+
+from uuid import RFC_4122
+
+from app.utils import ids
+from app.utils.ids import uuid7
+
+
+class TestUuid7:
+    """Test time-ordered UUID generation."""
+
+    def test_version_and_variant(self):
+        """Test generated values are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == RFC_4122
+
+    def test_unique_over_batch(self):
+        """Test a batch of values contains no duplicates."""
+        values = [uuid7() for _ in range(10_000)]
+
+        assert len(set(values)) == len(values)
+
+    def test_later_millisecond_sorts_higher(self, monkeypatch):
+        """Test values from a later millisecond sort after earlier ones."""
+        now_ns = 1_750_000_000_000 * 1_000_000
+
+        monkeypatch.setattr(ids.time, "time_ns", lambda: now_ns)
+        earlier = [uuid7() for _ in range(100)]
+        monkeypatch.setattr(ids.time, "time_ns", lambda: now_ns + 1_000_000)
+        later = [uuid7() for _ in range(100)]
+
+        assert max(earlier) < min(later)
+        assert max(u.int for u in earlier) >> 80 == now_ns // 1_000_000